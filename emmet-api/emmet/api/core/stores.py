@@ -0,0 +1,62 @@
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from maggma.stores import MongoURIStore
+from pymongo import MongoClient
+
+
+def tuned_uri(uri: str, options: Dict[str, str]) -> str:
+    """
+    Adds default connection options to a MongoDB URI. Options already present
+    in the URI are left untouched; like pymongo, names are matched case-insensitively.
+    """
+    parts = urlsplit(uri)
+    # only the option names are parsed; the user's query string is kept verbatim,
+    # as pymongo does not unquote values such as authMechanismProperties
+    present = {name.lower() for name, _ in parse_qsl(parts.query, keep_blank_values=True)}
+    missing = urlencode([(name, value) for name, value in options.items() if name.lower() not in present])
+    query = "&".join(q for q in (parts.query, missing) if q)
+
+    # pymongo requires a "/" between the host list and any options
+    return urlunsplit(parts._replace(path=parts.path or "/", query=query))
+
+
+# Clients shared by stores with the same URI and client options
+_clients: Dict[Tuple[str, str], MongoClient] = {}
+
+
+def _shared_client(uri: str, client_kwargs: Dict[str, Any], force_reset: bool = False) -> MongoClient:
+    """
+    One MongoClient (and connection pool) per URI and set of client options,
+    shared by all stores in the process. On reset the cached client is closed
+    and replaced by a new one.
+    """
+    # option values may be unhashable (e.g. a list of compressors)
+    key = (uri, repr(sorted(client_kwargs.items())))
+    if force_reset and key in _clients:
+        _clients.pop(key).close()
+    if key not in _clients:
+        _clients[key] = MongoClient(uri, **client_kwargs)
+    return _clients[key]
+
+
+class SharedClientMongoURIStore(MongoURIStore):
+    """
+    MongoURIStore that shares a single MongoClient with every other store
+    using the same URI and client options
+    """
+
+    def connect(self, force_reset: bool = False):
+        """
+        Connect to the collection through the shared client. force_reset
+        replaces the shared client for every store that connects after it.
+        """
+        if self._coll is None or force_reset:
+            conn = _shared_client(self.uri, self.mongoclient_kwargs, force_reset=force_reset)
+            self._coll = conn[self.database][self.collection_name]
+
+    def close(self):
+        """
+        Drop the collection handle, leaving the shared client open for the other stores
+        """
+        self._coll = None
@@ -1,3 +1,4 @@
+from fastapi.responses import ORJSONResponse
 from maggma.api.resource.read_resource import ReadOnlyResource
 from maggma.api.resource.post_resource import PostOnlyResource
 
@@ -42,6 +43,8 @@ def find_molecule_assoc_resource(assoc_store):
         timeout=timeout,
     )
 
+    resource.router.default_response_class = ORJSONResponse
+
     return resource
 
 
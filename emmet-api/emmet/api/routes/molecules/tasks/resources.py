@@ -1,3 +1,4 @@
+from fastapi.responses import ORJSONResponse
 from maggma.api.query_operator import PaginationQuery, SortQuery, SparseFieldsQuery
 from maggma.api.resource import ReadOnlyResource
 
@@ -62,6 +63,8 @@ def task_deprecation_resource(task_store):
         timeout=timeout,
     )
 
+    resource.router.default_response_class = ORJSONResponse
+
     return resource
 
 
@@ -1,6 +1,7 @@
 import os
+
 from emmet.api.core.settings import MAPISettings
-from maggma.stores import MongoURIStore
+from emmet.api.core.stores import SharedClientMongoURIStore, tuned_uri
 
 from emmet.api.routes.molecules.tasks.resources import (
     task_resource,
@@ -32,6 +33,26 @@ db_uri = os.environ.get("MPCONTRIBS_MONGO_HOST", None)
 db_version = default_settings.DB_VERSION
 db_suffix = os.environ["MAPI_DB_NAME_SUFFIX"]
 
+# Connection pool settings shared by every molecules store. Options already
+# present in the configured URI take precedence over these.
+pool_options = {
+    "maxPoolSize": "200",
+    "minPoolSize": "10",
+    "maxIdleTimeMS": "300000",
+    "waitQueueTimeoutMS": "10000",
+    "appname": "emmet-molecules",
+}
+
+
+def _store(collection_name: str, key: str) -> SharedClientMongoURIStore:
+    return SharedClientMongoURIStore(
+        uri=tuned_uri(db_uri, pool_options),
+        database="mp_molecules",
+        key=key,
+        collection_name=collection_name,
+    )
+
+
 if db_uri:
 
     # allow db_uri to be set with a different protocol scheme
@@ -39,49 +60,27 @@ if db_uri:
     if len(db_uri.split("://", 1)) < 2:
         db_uri = "mongodb+srv://" + db_uri
 
-    task_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="task_id", collection_name="mpcules_tasks",
-    )
+    task_store = _store("mpcules_tasks", "task_id")
 
-    assoc_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="molecule_id", collection_name="mpcules_assoc",
-    )
+    assoc_store = _store("mpcules_assoc", "molecule_id")
 
-    mol_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="molecule_id", collection_name="mpcules_molecules",
-    )
+    mol_store = _store("mpcules_molecules", "molecule_id")
 
-    charges_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_charges",
-    )
+    charges_store = _store("mpcules_charges", "property_id")
 
-    spins_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_spins",
-    )
+    spins_store = _store("mpcules_spins", "property_id")
 
-    bonds_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_bonds",
-    )
+    bonds_store = _store("mpcules_bonds", "property_id")
 
-    orbitals_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_orbitals",
-    )
+    orbitals_store = _store("mpcules_orbitals", "property_id")
 
-    redox_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_redox",
-    )
+    redox_store = _store("mpcules_redox", "property_id")
 
-    thermo_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_thermo",
-    )
+    thermo_store = _store("mpcules_thermo", "property_id")
 
-    vibes_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="property_id", collection_name="mpcules_vibes",
-    )
+    vibes_store = _store("mpcules_vibes", "property_id")
 
-    summary_store = MongoURIStore(
-        uri=db_uri, database="mp_molecules", key="molecule_id", collection_name="mpcules_summary"
-    )
+    summary_store = _store("mpcules_summary", "molecule_id")
 
 else:
     raise RuntimeError("Must specify MongoDB URI containing inputs.")
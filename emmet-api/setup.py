@@ -17,6 +17,7 @@ setup(
         "gunicorn",
         "boto3",
         "maggma",
+        "orjson",
         "ddtrace",
         "setproctitle",
         "shapely",
@@ -0,0 +1,25 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from maggma.stores import MemoryStore
+
+from emmet.api.routes.molecules.association.resources import find_molecule_assoc_resource
+from emmet.api.routes.molecules.molecules.resources import find_molecule_resource
+from emmet.api.routes.molecules.tasks.resources import task_deprecation_resource
+
+
+@pytest.mark.parametrize(
+    "resource_func",
+    [task_deprecation_resource, find_molecule_resource, find_molecule_assoc_resource],
+)
+def test_orjson_response_class(resource_func):
+    resource = resource_func(MemoryStore())
+
+    # the router's default response class is resolved when it is mounted on an app
+    app = FastAPI()
+    app.include_router(resource.router)
+
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert len(routes) > 0
+    assert all(route.response_class is ORJSONResponse for route in routes)
@@ -1,9 +1,9 @@
 # mypy: ignore-errors
 
 """ Core definition of a VASP Task Document """
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pymatgen.analysis.structure_analyzer import oxide_type
 from pymatgen.core.structure import Structure
 from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
@@ -12,7 +12,14 @@ from emmet.core.math import Matrix3D, Vector3D
 from emmet.core.task import BaseTaskDocument
 from emmet.core.structure import StructureMetadata
 from emmet.core.utils import ValueEnum
-from emmet.core.vasp.calc_types import RunType, calc_type, run_type, task_type
+from emmet.core.vasp.calc_types import (
+    CalcType,
+    RunType,
+    TaskType,
+    calc_type,
+    run_type,
+    task_type,
+)
 
 
 class TaskState(ValueEnum):
@@ -126,36 +133,71 @@ class TaskDocument(BaseTaskDocument, StructureMetadata):
         None, description="Any warnings related to this property"
     )
 
+    # run_type, task_type and calc_type are derived from the raw calculation
+    # inputs on first access and then reused
+    _run_type: Optional[RunType] = PrivateAttr(None)
+    _task_type: Optional[TaskType] = PrivateAttr(None)
+    _calc_type: Optional[CalcType] = PrivateAttr(None)
+    # oxide_type is shared by entry and structure_entry
+    _oxide_type: Optional[str] = PrivateAttr(None)
+
+    def copy(self, **kwargs) -> "TaskDocument":
+        """
+        Copies the task document; derived values are recomputed for
+        the copy in case the update changes the calculation inputs or outputs
+        """
+        new = super().copy(**kwargs)
+        new._run_type = None
+        new._task_type = None
+        new._calc_type = None
+        new._oxide_type = None
+        return new
+
     @property
-    def run_type(self) -> RunType:
+    def _output_oxide_type(self) -> str:
+        if self._oxide_type is None:
+            self._oxide_type = oxide_type(self.output.structure)
+
+        return self._oxide_type
+
+    @property
+    def _merged_params(self) -> Dict:
         params = self.calcs_reversed[0].get("input", {}).get("parameters", {})
         incar = self.calcs_reversed[0].get("input", {}).get("incar", {})
 
-        return run_type({**params, **incar})
+        return {**params, **incar}
 
     @property
-    def task_type(self):
-        return task_type(self.orig_inputs)
+    def run_type(self) -> RunType:
+        if self._run_type is None:
+            self._run_type = run_type(self._merged_params)
+
+        return self._run_type
 
     @property
-    def calc_type(self):
-        inputs = (
-            self.calcs_reversed[0].get("input", {})
-            if len(self.calcs_reversed) > 0
-            else self.orig_inputs
-        )
-        params = self.calcs_reversed[0].get("input", {}).get("parameters", {})
-        incar = self.calcs_reversed[0].get("input", {}).get("incar", {})
+    def task_type(self) -> TaskType:
+        if self._task_type is None:
+            self._task_type = task_type(self.orig_inputs)
 
-        return calc_type(inputs, {**params, **incar})
+        return self._task_type
 
     @property
-    def entry(self) -> ComputedEntry:
-        """Turns a Task Doc into a ComputedEntry"""
-        entry_dict = {
+    def calc_type(self) -> CalcType:
+        if self._calc_type is None:
+            inputs = (
+                self.calcs_reversed[0].get("input", {})
+                if len(self.calcs_reversed) > 0
+                else self.orig_inputs
+            )
+            self._calc_type = calc_type(inputs, self._merged_params)
+
+        return self._calc_type
+
+    def _base_entry_kwargs(self, aspherical_default: bool) -> Dict[str, Any]:
+        """Arguments shared by the ComputedEntry and ComputedStructureEntry of this task"""
+        return {
             "correction": 0.0,
             "entry_id": self.task_id,
-            "composition": self.output.structure.composition,
             "energy": self.output.energy,
             "parameters": {
                 "potcar_spec": self.input.potcar_spec,
@@ -165,35 +207,24 @@ class TaskDocument(BaseTaskDocument, StructureMetadata):
                 "run_type": str(self.run_type),
             },
             "data": {
-                "oxide_type": oxide_type(self.output.structure),
-                "aspherical": self.input.parameters.get("LASPH", True),
+                "oxide_type": self._output_oxide_type,
+                "aspherical": self.input.parameters.get("LASPH", aspherical_default),
                 "last_updated": self.last_updated,
             },
         }
 
-        return ComputedEntry.from_dict(entry_dict)
+    @property
+    def entry(self) -> ComputedEntry:
+        """Turns a Task Doc into a ComputedEntry"""
+        return ComputedEntry(
+            composition=self.output.structure.composition,
+            **self._base_entry_kwargs(aspherical_default=True),
+        )
 
     @property
     def structure_entry(self) -> ComputedStructureEntry:
         """Turns a Task Doc into a ComputedStructureEntry"""
-        entry_dict = {
-            "correction": 0.0,
-            "entry_id": self.task_id,
-            "composition": self.output.structure.composition,
-            "energy": self.output.energy,
-            "parameters": {
-                "potcar_spec": self.input.potcar_spec,
-                "is_hubbard": self.input.is_hubbard,
-                "hubbards": self.input.hubbards,
-                # This is done to be compatible with MontyEncoder for the ComputedEntry
-                "run_type": str(self.run_type),
-            },
-            "data": {
-                "oxide_type": oxide_type(self.output.structure),
-                "aspherical": self.input.parameters.get("LASPH", False),
-                "last_updated": self.last_updated,
-            },
-            "structure": self.output.structure,
-        }
-
-        return ComputedStructureEntry.from_dict(entry_dict)
+        return ComputedStructureEntry(
+            structure=self.output.structure,
+            **self._base_entry_kwargs(aspherical_default=False),
+        )
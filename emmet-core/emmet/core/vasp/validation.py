@@ -1,5 +1,9 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Union, Optional
+from itertools import islice
+from typing import Deque, Dict, Iterable, Iterator, List, Union, Optional
 
 import numpy as np
 from pydantic import Field, PyObject
@@ -80,24 +84,27 @@ class ValidationDoc(EmmetBaseModel):
             potcar_hashes: Dictionary of potcar hash data. Mapping is calculation type -> potcar symbol -> hash value.
         """
 
-        bandgap = task_doc.output.bandgap
         calc_type = task_doc.calc_type
-        task_type = task_doc.task_type
-        run_type = task_doc.run_type
-        inputs = task_doc.orig_inputs
-        chemsys = task_doc.chemsys
-        calcs_reversed = task_doc.calcs_reversed
-
-        if calcs_reversed[0].get("input", {}).get("structure", None):
-            structure = Structure.from_dict(calcs_reversed[0]["input"]["structure"])
-        else:
-            structure = task_doc.input.structure or task_doc.output.structure
 
         reasons = []
         data = {}  # type: ignore
         warnings: List[str] = []
 
+        # Tasks without a reference input set are not checked, so only
+        # read the rest of the task document when there is something to validate
         if str(calc_type) in input_sets:
+            bandgap = task_doc.output.bandgap
+            task_type = task_doc.task_type
+            run_type = task_doc.run_type
+            inputs = task_doc.orig_inputs
+            chemsys = task_doc.chemsys
+            calcs_reversed = task_doc.calcs_reversed
+
+            if calcs_reversed[0].get("input", {}).get("structure", None):
+                structure = Structure.from_dict(calcs_reversed[0]["input"]["structure"])
+            else:
+                structure = task_doc.input.structure or task_doc.output.structure
+
             try:
                 valid_input_set = _get_input_set(run_type, task_type, calc_type, structure, input_sets, bandgap)
 
@@ -176,7 +183,7 @@ class ValidationDoc(EmmetBaseModel):
                 else:
                     reasons.append(DeprecationMessage.SET)
 
-        doc = ValidationDoc(
+        doc = cls(
             task_id=task_doc.task_id,
             calc_type=calc_type,
             run_type=task_doc.run_type,
@@ -188,6 +195,52 @@ class ValidationDoc(EmmetBaseModel):
 
         return doc
 
+    @classmethod
+    def from_task_docs(
+        cls,
+        task_docs: Iterable[TaskDocument],
+        workers: Optional[int] = None,
+        chunk_size: int = 50,
+        **kwargs,
+    ) -> Iterator["ValidationDoc"]:
+        """
+        Validates many task documents in parallel worker processes. Task documents are
+        read lazily, so a (batched) database cursor can be passed in directly, and
+        validation documents are yielded in the same order as the task documents
+
+        Args:
+            task_docs: the task documents to process
+            workers: number of worker processes, defaults to the number of CPUs
+            chunk_size: number of task documents sent to a worker at a time
+            kwargs: validation settings passed on to `from_task_doc`
+        """
+        workers = workers or os.cpu_count() or 1
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()  # type: Deque
+            for chunk in _chunks(task_docs, chunk_size):
+                pending.append(executor.submit(_validate_chunk, cls, chunk, kwargs))
+
+                # Only keep a few chunks per worker in flight so task_docs isn't exhausted up front
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _validate_chunk(doc_cls, task_docs: List[TaskDocument], kwargs: Dict) -> List[ValidationDoc]:
+    return [doc_cls.from_task_doc(task_doc, **kwargs) for task_doc in task_docs]
+
 
 def _get_input_set(run_type, task_type, calc_type, structure, input_sets, bandgap):
     # Ensure inputsets get proper additional input values
@@ -210,8 +263,8 @@ def _get_input_set(run_type, task_type, calc_type, structure, input_sets, bandga
 def _scf_upward_check(calcs_reversed, inputs, data, max_allowed_scf_gradient, warnings):
     skip = abs(inputs.get("incar", {}).get("NLEMDL", -5)) - 1
     energies = [d["e_fr_energy"] for d in calcs_reversed[0]["output"]["ionic_steps"][-1]["electronic_steps"]]
-    if len(energies) > skip:
-        max_gradient = np.max(np.gradient(energies)[skip:])
+    if len(energies) > max(skip, 1):
+        max_gradient = _max_scf_gradient(energies, skip)
         data["max_gradient"] = max_gradient
         if max_gradient > max_allowed_scf_gradient:
             return True
@@ -222,6 +275,28 @@ def _scf_upward_check(calcs_reversed, inputs, data, max_allowed_scf_gradient, wa
         return False
 
 
+def _max_scf_gradient(energies, skip):
+    """
+    Largest SCF energy gradient after the first `skip` steps. Equivalent to
+    np.max(np.gradient(energies)[skip:]) without building the intermediate arrays;
+    a negative `skip` (NLEMDL = 0) counts from the end, as in the slice
+    """
+    if skip < 0:
+        skip = max(len(energies) + skip, 0)
+
+    # one-sided differences at the ends, central differences in between
+    max_gradient = energies[-1] - energies[-2]
+    if skip == 0:
+        max_gradient = max(max_gradient, energies[1] - energies[0])
+
+    for i in range(max(skip, 1), len(energies) - 1):
+        gradient = (energies[i + 1] - energies[i - 1]) * 0.5
+        if gradient > max_gradient:
+            max_gradient = gradient
+
+    return max_gradient
+
+
 def _u_value_checks(task_doc, valid_input_set, warnings):
     # NOTE: Reverting to old method of just using input.hubbards which is wrong in many instances
     input_hubbards = task_doc.input.hubbards
@@ -235,16 +310,19 @@ def _u_value_checks(task_doc, valid_input_set, warnings):
             )
         )
 
-        all_elements = list(set(input_set_hubbards.keys()) | set(input_hubbards.keys()))
-        diff_ldau_params = {
-            el: (input_set_hubbards.get(el, 0), input_hubbards.get(el, 0))
-            for el in all_elements
-            if not np.allclose(input_set_hubbards.get(el, 0), input_hubbards.get(el, 0))
-        }
+        # Compare all elements at once as aligned arrays of expected and actual U-values
+        all_elements = sorted(set(input_set_hubbards.keys()) | set(input_hubbards.keys()))
+        expected = [input_set_hubbards.get(el, 0) for el in all_elements]
+        actual = [input_hubbards.get(el, 0) for el in all_elements]
+        mismatched = ~np.isclose(np.asarray(expected, dtype=float), np.asarray(actual, dtype=float))
 
-        if len(diff_ldau_params) > 0:
+        if mismatched.any():
             warnings.extend(
-                [f"U-value for {el} should be {good} but was {bad}" for el, (good, bad) in diff_ldau_params.items()]
+                [
+                    f"U-value for {el} should be {good} but was {bad}"
+                    for el, good, bad, diff in zip(all_elements, expected, actual, mismatched)
+                    if diff
+                ]
             )
             return True
 
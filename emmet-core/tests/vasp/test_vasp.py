@@ -1,11 +1,12 @@
 import json
 
+import numpy as np
 import pytest
 from monty.io import zopen
 
 from emmet.core.vasp.calc_types import RunType, TaskType, run_type, task_type
 from emmet.core.vasp.task_valid import TaskDocument
-from emmet.core.vasp.validation import ValidationDoc
+from emmet.core.vasp.validation import ValidationDoc, _max_scf_gradient
 
 
 def test_task_type():
@@ -56,12 +57,62 @@ def test_validator(tasks):
     assert all(doc.valid for doc in validation_docs)
 
 
+class _SubValidationDoc(ValidationDoc):
+    pass
+
+
+def test_validator_parallel(tasks):
+    validation_docs = list(ValidationDoc.from_task_docs(tasks, workers=2, chunk_size=1))
+
+    assert [doc.task_id for doc in validation_docs] == [task.task_id for task in tasks]
+    assert all(doc.valid for doc in validation_docs)
+
+    # subclasses get their own documents back
+    validation_docs = list(_SubValidationDoc.from_task_docs(tasks, workers=2, chunk_size=2))
+    assert all(isinstance(doc, _SubValidationDoc) for doc in validation_docs)
+
+
 def test_computed_entry(tasks):
     entries = [task.entry for task in tasks]
     ids = {e.entry_id for e in entries}
     assert ids == {"mp-1141021", "mp-149", "mp-1686587", "mp-1440634"}
 
 
+def test_computed_structure_entry(tasks):
+    for task in tasks:
+        entry = task.entry
+        structure_entry = task.structure_entry
+
+        assert structure_entry.entry_id == entry.entry_id
+        assert structure_entry.energy == pytest.approx(entry.energy)
+        assert structure_entry.composition == entry.composition
+        assert structure_entry.parameters == entry.parameters
+        assert structure_entry.data["oxide_type"] == entry.data["oxide_type"]
+        assert structure_entry.structure == task.output.structure
+
+
+def test_derived_types_not_shared(tasks):
+    task = tasks[0]
+    original_task_type = task.task_type
+
+    copied = task.copy(update={"orig_inputs": {"incar": {"LEPSILON": True}}})
+    assert copied.task_type == TaskType.Dielectric
+    assert task.task_type == original_task_type
+
+    copied._calc_type = "Fake"
+    assert task.calc_type != "Fake"
+
+
+def test_max_scf_gradient():
+    energies = [-10.0, -12.5, -11.0, -11.2, -11.25, -11.249, -11.2491]
+
+    # NLEMDL = 0 gives skip = -1
+    for skip in range(-1, len(energies)):
+        assert _max_scf_gradient(energies, skip) == pytest.approx(
+            np.max(np.gradient(energies)[skip:])
+        )
+
+
 @pytest.fixture(scope="session")
 def task_ldau(test_dir):
     with zopen(test_dir / "test_task.json") as f: